@@ -125,7 +125,9 @@ class RawLogChunkEndpoint(LogChunkEndpointBase):
             logid, 0, lastline)
 
         if dbdict['type'] == 's':
-            logLines = "\n".join([line[1:] for line in logLines.splitlines()])
+            # lines are delimited by '\n' only; splitlines() would also break
+            # on form feeds and other control characters inside a line
+            logLines = "\n".join([line[1:] for line in logLines.rstrip("\n").split("\n")])
 
         return {'raw': logLines,
                 'mime-type': 'text/html' if dbdict['type'] == 'h' else 'text/plain',
@@ -13,8 +13,6 @@
 #
 # Copyright Buildbot Team Members
 
-import re
-
 from twisted.internet import defer
 from twisted.python import log
 
@@ -165,8 +163,6 @@ Log._byType['h'] = HtmlLog
 
 class StreamLog(Log):
 
-    pat = re.compile('^', re.M)
-
     def __init__(self, step, name, type, logid, decoder):
         super().__init__(step, name, type, logid, decoder)
         self.lbfs = {}
@@ -178,9 +174,11 @@ class StreamLog(Log):
             def wholeLines(lines):
                 # deliver the un-annotated version to subscribers
                 self.subPoint.deliver(stream, lines)
-                # strip the last character, as the regexp will add a
-                # prefix character after the trailing newline
-                return self.addRawLines(self.pat.sub(stream, lines)[:-1])
+                # prefix every line with the stream character; strip the last
+                # character, as the replace will add a prefix character after
+                # the trailing newline
+                return self.addRawLines(
+                    (stream + lines.replace('\n', '\n' + stream))[:-1])
             lbf = self.lbfs[stream] = \
                 lineboundaries.LineBoundaryFinder(wholeLines)
             return lbf
@@ -147,13 +147,7 @@ def timeMethod(name, _reactor=None):
 class FiniteList(deque):
 
     def __init__(self, maxlen=10):
-        self._maxlen = maxlen
-        super().__init__()
-
-    def append(self, o):
-        deque.append(self, o)
-        if len(self) > self._maxlen:
-            self.popleft()
+        super().__init__(maxlen=maxlen)
 
 
 class AveragingFiniteList(FiniteList):
@@ -72,29 +72,26 @@ def get_message_summary_text(build, results):
 
 
 def get_message_source_stamp_text(source_stamps):
-    text = ""
+    lines = []
 
     for ss in source_stamps:
-        source = ""
+        parts = []
 
         if ss['branch']:
-            source += "[branch {}] ".format(ss['branch'])
+            parts.append("[branch {}]".format(ss['branch']))
 
-        if ss['revision']:
-            source += str(ss['revision'])
-        else:
-            source += "HEAD"
+        parts.append(str(ss['revision']) if ss['revision'] else "HEAD")
 
         if ss['patch'] is not None:
-            source += " (plus patch)"
+            parts.append("(plus patch)")
 
         discriminator = ""
         if ss['codebase']:
             discriminator = " '{}'".format(ss['codebase'])
 
-        text += "Build Source Stamp{}: {}\n".format(discriminator, source)
+        lines.append("Build Source Stamp{}: {}\n".format(discriminator, " ".join(parts)))
 
-    return text
+    return "".join(lines)
 
 
 def get_projects_text(source_stamps, master):
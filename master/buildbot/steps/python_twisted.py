@@ -103,6 +103,11 @@ class HLint(buildstep.ShellMixin, buildstep.BuildStep):
 
 class TrialTestCaseCounter(logobserver.LogLineObserver):
     _line_re = re.compile(r'^(?:Doctest: )?([\w\.]+) \.\.\. \[([^\]]+)\]$')
+    _ran_re = re.compile(r'Ran (\d+) tests')
+    # successes= is a Twisted-2.0 addition, and is not currently used
+    _counts_res = [(name, re.compile(r'{}=(\d+)'.format(name)))
+                   for name in ('failures', 'errors', 'skips', 'expectedFailures',
+                                'unexpectedSuccesses', 'successes')]
 
     def __init__(self):
         super().__init__()
@@ -135,7 +140,7 @@ class TrialTestCaseCounter(logobserver.LogLineObserver):
                 self.numTests += 1
                 self.step.setProgress('tests', self.numTests)
 
-        out = re.search(r'Ran (\d+) tests', line)
+        out = self._ran_re.search(line)
         if out:
             self.counts['total'] = int(out.group(1))
         if (line.startswith("OK") or
@@ -145,25 +150,10 @@ class TrialTestCaseCounter(logobserver.LogLineObserver):
             # status from an individual test which failed. The lack of a
             # space on the OK is because it may be printed without any
             # additional text (if there are no skips,etc)
-            out = re.search(r'failures=(\d+)', line)
-            if out:
-                self.counts['failures'] = int(out.group(1))
-            out = re.search(r'errors=(\d+)', line)
-            if out:
-                self.counts['errors'] = int(out.group(1))
-            out = re.search(r'skips=(\d+)', line)
-            if out:
-                self.counts['skips'] = int(out.group(1))
-            out = re.search(r'expectedFailures=(\d+)', line)
-            if out:
-                self.counts['expectedFailures'] = int(out.group(1))
-            out = re.search(r'unexpectedSuccesses=(\d+)', line)
-            if out:
-                self.counts['unexpectedSuccesses'] = int(out.group(1))
-            # successes= is a Twisted-2.0 addition, and is not currently used
-            out = re.search(r'successes=(\d+)', line)
-            if out:
-                self.counts['successes'] = int(out.group(1))
+            for name, count_re in self._counts_res:
+                out = count_re.search(line)
+                if out:
+                    self.counts[name] = int(out.group(1))
 
 
 UNSPECIFIED = ()  # since None is a valid choice
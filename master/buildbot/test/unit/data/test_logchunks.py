@@ -196,3 +196,15 @@ class RawLogChunkEndpoint(LogChunkEndpointBase):
 
         self.assertEqual(logchunk,
                          {'filename': expFilename, 'mime-type': "text/plain", 'raw': expContent})
+
+    @defer.inlineCallbacks
+    def test_get_stream_with_control_characters(self):
+        self.db.insertTestData([
+            fakedb.Log(id=63, stepid=50, name='ctrl', slug='ctrl', type='s',
+                       num_lines=2),
+            fakedb.LogChunk(logid=63, first_line=0, last_line=1, compressed=0,
+                            content="opage\x0cbreak\neline 1"),
+        ])
+        logchunk = yield self.callGet(('logs', 63, self.endpointname))
+        self.validateData(logchunk)
+        self.assertEqual(logchunk['raw'], "page\x0cbreak\nline 1")
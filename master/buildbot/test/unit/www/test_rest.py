@@ -13,6 +13,7 @@
 #
 # Copyright Buildbot Team Members
 
+import hashlib
 import json
 import re
 
@@ -348,6 +349,53 @@ class V2RootResource_REST(TestReactorMixin, www.WwwTestMixin,
         self.assertEqual(int(self.request.headers[b'content-length'][0]),
                          len(get))
 
+    @defer.inlineCallbacks
+    def test_api_cache_seconds(self):
+        self.master.config.www['json_cache_seconds'] = 60
+        self.rsrc.reconfigResource(self.master.config)
+        self.reactor.advance(1000000000)
+        yield self.render_resource(self.rsrc, b'/test')
+        self.assertRequest(
+            responseCode=200,
+            headers={b"Expires": [b'Sun, 09 Sep 2001 01:47:40 GMT'],
+                     b"Pragma": [b'no-cache']})
+
+    @defer.inlineCallbacks
+    def test_api_etag(self):
+        get = yield self.render_resource(self.rsrc, b'/test')
+        etag = self.request.headers[b'ETag'][0]
+        self.assertEqual(etag, b'"' + hashlib.sha1(get).hexdigest().encode() + b'"')
+
+        res = yield self.render_resource(self.rsrc, b'/test',
+                                         extraHeaders={b'if-none-match': b'"x", ' + etag})
+        self.assertEqual(res, b'')
+        self.assertRequest(responseCode=304, headers={b'ETag': [etag]})
+
+    @defer.inlineCallbacks
+    def test_api_etag_weak(self):
+        yield self.render_resource(self.rsrc, b'/test')
+        etag = self.request.headers[b'ETag'][0]
+
+        res = yield self.render_resource(self.rsrc, b'/test',
+                                         extraHeaders={b'if-none-match': b'W/' + etag})
+        self.assertEqual(res, b'')
+        self.assertRequest(responseCode=304)
+
+    @defer.inlineCallbacks
+    def test_api_etag_star(self):
+        res = yield self.render_resource(self.rsrc, b'/test',
+                                         extraHeaders={b'if-none-match': b'*'})
+        self.assertEqual(res, b'')
+        self.assertRequest(responseCode=304)
+
+    @defer.inlineCallbacks
+    def test_api_etag_mismatch(self):
+        get = yield self.render_resource(self.rsrc, b'/test')
+        res = yield self.render_resource(self.rsrc, b'/test',
+                                         extraHeaders={b'if-none-match': b'"x"'})
+        self.assertEqual(res, get)
+        self.assertRequest(responseCode=200)
+
     @defer.inlineCallbacks
     def test_api_collection(self):
         yield self.render_resource(self.rsrc, b'/test')
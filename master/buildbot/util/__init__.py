@@ -494,7 +494,7 @@ def rewrap(text, width=None):
         return not line[0].isspace()
 
     # Split text by lines and group lines that comprise paragraphs.
-    wrapped_text = ""
+    paragraphs = []
     for do_wrap, lines in itertools.groupby(text.splitlines(True),
                                             key=needs_wrapping):
         paragraph = ''.join(lines)
@@ -502,9 +502,9 @@ def rewrap(text, width=None):
         if do_wrap:
             paragraph = textwrap.fill(paragraph, width)
 
-        wrapped_text += paragraph
+        paragraphs.append(paragraph)
 
-    return wrapped_text
+    return ''.join(paragraphs)
 
 
 def dictionary_merge(a, b):
@@ -60,7 +60,10 @@ class LineBoundaryFinder:
                 return self.callback("\n".join(ret) + "\n")
             text = self.partialLine + text
             self.partialLine = None
-        text = self.newline_re.sub('\n', text)
+        # most output contains none of the sequences newline_re rewrites, so
+        # check for their leading characters before running the regex
+        if '\r' in text or '\033' in text or '\x08' in text:
+            text = self.newline_re.sub('\n', text)
         if text:
             if text[-1] != '\n':
                 i = text.rfind('\n')
@@ -14,8 +14,8 @@
 # Copyright Buildbot Team Members
 
 import cgi
-import datetime
 import fnmatch
+import hashlib
 import json
 import re
 from contextlib import contextmanager
@@ -23,6 +23,7 @@ from urllib.parse import urlparse
 
 from twisted.internet import defer
 from twisted.python import log
+from twisted.web import http
 from twisted.web.error import Error
 
 from buildbot.data import exceptions
@@ -326,13 +327,11 @@ class V2RootResource(resource.Resource):
                 request.setHeader(b"content-type",
                                   b'text/plain; charset=utf-8')
 
-            # set up caching
+            # set up caching; datetimeToString formats the HTTP date without
+            # going through the locale-dependent strftime
             if self.cache_seconds:
-                now = datetime.datetime.utcnow()
-                expires = now + datetime.timedelta(seconds=self.cache_seconds)
-                expiresBytes = unicode2bytes(
-                    expires.strftime("%a, %d %b %Y %H:%M:%S GMT"))
-                request.setHeader(b"Expires", expiresBytes)
+                expires = self.master.reactor.seconds() + self.cache_seconds
+                request.setHeader(b"Expires", http.datetimeToString(expires))
                 request.setHeader(b"Pragma", b"no-cache")
 
             # filter out blanks if necessary and render the data
@@ -343,12 +342,31 @@ class V2RootResource(resource.Resource):
                 data = json.dumps(data, default=toJson,
                                   sort_keys=True, indent=2)
 
+            data = unicode2bytes(data)
+
+            # let clients revalidate with If-None-Match rather than download
+            # an unchanged response again
+            etag = b'"' + unicode2bytes(hashlib.sha1(data).hexdigest()) + b'"'
+            request.setHeader(b"ETag", etag)
+            if self.matchesETag(request, etag):
+                request.setResponseCode(304)
+                return
+
             if request.method == b"HEAD":
                 request.setHeader(b"content-length", unicode2bytes(str(len(data))))
             else:
-                data = unicode2bytes(data)
                 request.write(data)
 
+    def matchesETag(self, request, etag):
+        ifNoneMatch = request.getHeader(b'if-none-match')
+        if not ifNoneMatch:
+            return False
+        # If-None-Match uses the weak comparison (RFC 7232, 3.2); proxies such
+        # as nginx with gzip enabled turn our strong tag into a W/ one
+        tags = [t.strip() for t in ifNoneMatch.split(b',')]
+        tags = [t[2:] if t.startswith(b'W/') else t for t in tags]
+        return etag in tags or b'*' in tags
+
     def reconfigResource(self, new_config):
         # buildbotURL may contain reverse proxy path, Origin header is just
         # scheme + host + port
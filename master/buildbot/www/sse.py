@@ -44,10 +44,11 @@ class Consumer:
         request = self.request
         key = [bytes2unicode(e) for e in event]
         msg = dict(key=key, message=data)
-        request.write(b"event: " + b"event" + b"\n")
-        request.write(
-            b"data: " + unicode2bytes(json.dumps(msg, default=toJson)) + b"\n")
-        request.write(b"\n")
+        # join the frame once so the payload is only copied a single time
+        request.write(b"".join([
+            b"event: event\n",
+            b"data: ", unicode2bytes(json.dumps(msg, default=toJson)), b"\n",
+            b"\n"]))
 
     def registerQref(self, path, qref):
         self.qrefs[path] = qref
@@ -0,0 +1 @@
+The REST API now sends an ``ETag`` header and answers ``If-None-Match`` requests for unchanged data with ``304 Not Modified``.